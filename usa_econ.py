@@ -1,25 +1,176 @@
+import argparse
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
 import numpy as np
 from datetime import datetime, timedelta
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from enum import IntEnum
 import time
-import json
-from typing import Dict, List, Tuple
+import threading
+import orjson
+import hashlib
+import io
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import redis
+except ImportError:  # Redis önbelleği isteğe bağlıdır
+    redis = None
+
+# Seri başına önbellek süresi (saniye) - yayın sıklığına göre
+_TTL_SHORT = 3600           # Günlük seriler
+_TTL_NORMAL = 12 * 3600     # Aylık seriler
+_TTL_LONG = 7 * 86400       # Çeyreklik seriler
+_TTL = {
+    'DEXUSEU': _TTL_SHORT,
+    'DGS10': _TTL_SHORT,
+    'UNRATE': _TTL_NORMAL,
+    'PAYEMS': _TTL_NORMAL,
+    'GDPC1': _TTL_LONG,
+    'GPDI': _TTL_LONG
+}
+_STALE_TTL = 30 * 86400     # API kesintisinde kullanılacak son başarılı veri
+
+# Piyasa duyarlılığı göstergeleri: +1 artış pozitif, -1 artış negatif
+_SENTIMENT_EFFECTS = {
+    'UNRATE': -1,    # İşsizlik yüksek = negatif
+    'CPIAUCSL': -1,  # Enflasyon yüksek = negatif
+    'FEDFUNDS': -1,  # Faiz yüksek = negatif
+    'PAYEMS': 1,     # İstihdam artışı = pozitif
+    'UMCSENT': 1,    # Tüketici güveni = pozitif
+    'INDPRO': 1      # Sanayi üretimi = pozitif
+}
+_SENTIMENT_SIGNS = np.fromiter(_SENTIMENT_EFFECTS.values(), dtype=np.int8)
+
+
+class Trend(IntEnum):
+    """Trend sınıfları - sıralı olduğundan "düşüş" kontrolü `trend <= Trend.DOWN` şeklinde yapılır"""
+    STRONG_DOWN = 0
+    DOWN = 1
+    FLAT = 2
+    UP = 3
+    STRONG_UP = 4
+
+
+class Volatility(IntEnum):
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
+
+# Rapor metni; None = yetersiz veri
+_TREND_TEXT = {
+    Trend.STRONG_DOWN: "📉 Güçlü Düşüş",
+    Trend.DOWN: "🔽 Hafif Düşüş",
+    Trend.FLAT: "➡️ Stabil",
+    Trend.UP: "🔼 Hafif Yükseliş",
+    Trend.STRONG_UP: "📈 Güçlü Yükseliş",
+    None: "Yetersiz veri"
+}
+
+# Risk seviyesine göre stratejik öneriler
+_STRATEGY_TIPS = {
+    'HIGH': (
+        "⚠️ Yüksek risk ortamı - pozisyon boyutlarını küçült",
+        "🛡️ Hedge stratejileri değerlendir",
+        "📰 Fed açıklamalarını yakından takip et"
+    ),
+    'MEDIUM': (
+        "⚖️ Dengeli yaklaşım - makro verileri izle",
+        "📊 Teknik analiz ile kombine et",
+        "🎯 Seçici olmaya odaklan"
+    ),
+    'LOW': (
+        "🟢 Düşük risk ortamı - fırsatları değerlendir",
+        "📈 Trend takibi stratejileri uygula",
+        "💪 Pozisyon boyutlarını artırabilirsin"
+    )
+}
+
+# Sınıflandırma eşikleri; np.searchsorted(eşikler, x) doğrudan sınıf indeksini verir.
+# Trend: ortalama değişim > 0.1 güçlü yükseliş, > 0.01 hafif yükseliş, < -0.01 hafif düşüş,
+# < -0.1 güçlü düşüş. Negatif eşikler katı "<" ile aynı sonucu vermesi için bir ulp aşağı kaydırılır.
+_TREND_BINS = np.array([np.nextafter(-0.1, -np.inf), np.nextafter(-0.01, -np.inf), 0.01, 0.1])
+_VOLATILITY_BINS = np.array([0.05, 0.1])  # > 0.05 orta, > 0.1 yüksek
+_SENTIMENT_BINS = np.array([0.4, 0.7])    # Pozitif oran >= 0.4 nötr, >= 0.7 pozitif (side='right')
+_SENTIMENT_LEVELS = (
+    ("🔴 Negatif", "HIGH"),
+    ("🟡 Nötr", "MEDIUM"),
+    ("🟢 Pozitif", "LOW")
+)
+
+# Önbellek modları: enabled (varsayılan), replay (yalnızca önbellek - API'ye gidilmez),
+# disabled (önbellek okunmaz ve yazılmaz)
+CACHE_MODES = ("enabled", "replay", "disabled")
+
+
+class CacheMiss(RuntimeError):
+    """Replay modunda istenen seri önbellekte bulunamadı"""
+
+
+class Series(NamedTuple):
+    """Tek bir FRED serisi - eskiden yeniye sıralı tarih ve değer dizileri"""
+    dates: np.ndarray   # datetime64[ns]
+    values: np.ndarray  # float64
+
+
+class Analysis(NamedTuple):
+    """Rapor başına bir kez hesaplanan analiz sonuçları (bkz. EconomicAnalyzer._precompute)"""
+    trend: Dict[str, Optional[Trend]]
+    vol: Dict[str, Optional[Volatility]]
+    sentiment: Tuple[str, str]
+
+
+def ttl_for(series_id: str) -> int:
+    """Seri için önbellek süresini döndür"""
+    return _TTL.get(series_id, _TTL_NORMAL)
+
+
+def _dump_series(series: Series, file):
+    """Seriyi .npz biçiminde dosyaya/tampona yaz"""
+    np.savez(file, dates=series.dates, values=series.values)
+
+
+def _load_series(file) -> Series:
+    """.npz biçimindeki seriyi oku"""
+    with np.load(file) as npz:
+        return Series(npz['dates'], npz['values'])
+
+
 class EconomicAnalyzer:
     """
     ABD Ekonomik Veri Analizi ve Tahmin Sistemi
     FRED API kullanarak güncel ekonomik verileri çeker ve analiz eder
     """
     
-    def __init__(self, fred_api_key: str):
+    # Veri alınamadığında döndürülen ortak boş seri (paylaşıldığı için değiştirilmemeli)
+    _EMPTY_SERIES = Series(np.empty(0, dtype='datetime64[ns]'), np.empty(0, dtype=np.float64))
+    
+    def __init__(self, fred_api_key: str, redis_url: Optional[str] = None, cache_mode: str = "enabled"):
         """
         API anahtarı https://fred.stlouisfed.org/docs/api/api_key.html adresinden alınabilir
+        redis_url verilirse (örn. redis://localhost:6379/0) API yanıtları Redis'te önbelleklenir
+        cache_mode="replay" ile yalnızca önbellekteki veriler kullanılır (bkz. CACHE_MODES)
         """
+        if cache_mode not in CACHE_MODES:
+            raise ValueError(f"Geçersiz önbellek modu: {cache_mode} (seçenekler: {', '.join(CACHE_MODES)})")
+        
         self.fred_api_key = fred_api_key
         self.base_url = "https://api.stlouisfed.org/fred"
+        self.cache_mode = cache_mode
+        
+        # Aynı gün tekrar çalıştırmalarda ağa gitmemek için yerel .npz önbelleği
+        self.cache_dir = Path.home() / ".cache" / "econ"
+        
+        self.redis = None
+        if redis_url and cache_mode != "disabled":
+            if redis is None:
+                print("⚠️ redis paketi kurulu değil - önbellek devre dışı")
+            else:
+                self.redis = redis.Redis.from_url(redis_url)
         
         self.indicators = {
             'UNRATE': 'İşsizlik Oranı (%)',
@@ -37,175 +188,286 @@ class EconomicAnalyzer:
             'GPDI': 'Brüt Özel Yatırım',
             'PCEC96': 'Reel Kişisel Tüketim Harcamaları'
         }
+        # Sabit sıralı (kod, ad) çiftleri - döngülerde her seferinde dict görünümü oluşturulmaz
+        self._indicator_items = tuple(self.indicators.items())
+        # predict_next_day_events'teki toplu trend hesabı için her çalıştırmada yeniden kullanılan diziler
+        self._scratch = np.empty((len(self._indicator_items), 5), dtype=np.float64)
+        self._avg_buf = np.empty(len(self._indicator_items), dtype=np.float64)
+        
+        # TCP/TLS bağlantıları çağrılar arasında yeniden kullanılır; havuz tüm göstergeler
+        # aynı anda istendiğinde bağlantı atılmayacak büyüklükte
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=len(self.indicators))
+        self._session.mount("https://", adapter)
+        # Her istekte aynı kalan parametreler oturuma bir kez yazılır
+        self._session.params = {
+            'api_key': self.fred_api_key,
+            'file_type': 'json',
+            'sort_order': 'desc',
+            'limit': 20  # Trend son 5, volatilite en az 10 gözlem kullanır
+        }
+        self._observations_url = f"{self.base_url}/series/observations"
+        self.request_timeout = 10
+        # Paralel veri çekiminde mesajlar iş parçacığı başına toplanır (bkz. _log, _fetch)
+        self._log_local = threading.local()
         
         self.risk_levels = {
             'LOW': '🟢 Düşük Risk',
             'MEDIUM': '🟡 Orta Risk', 
             'HIGH': '🔴 Yüksek Risk'
         }
+
+    
+    def _log(self, message: str):
+        """Mesajı yazdır; paralel veri çekimi sırasında toplanır ve sırayla yazdırılır"""
+        messages = getattr(self._log_local, 'messages', None)
+        if messages is None:
+            print(message)
+        else:
+            messages.append(message)
     
-    def get_fred_data(self, series_id: str, start_date: str = None, end_date: str = None) -> pd.DataFrame:
+    def _fetch(self, series_id: str) -> Tuple[Series, List[str]]:
+        """Seriyi iş parçacığında çek; mesajları iç içe geçmesin diye ayrıca döndür"""
+        self._log_local.messages = messages = []
+        try:
+            return self.get_fred_data(series_id), messages
+        finally:
+            self._log_local.messages = None
+    
+    def _redis_get(self, key: str) -> Optional[Series]:
+        """Redis önbelleğinden seri oku"""
+        if self.redis is None:
+            return None
+        try:
+            raw = self.redis.get(key)
+        except redis.RedisError as e:
+            self._log(f"⚠️ Önbellek okunamadı: {str(e)}")
+            return None
+        if raw is None:
+            return None
+        try:
+            return _load_series(io.BytesIO(raw))
+        except Exception as e:  # Bozuk kayıt önbellekte yok sayılır
+            self._log(f"⚠️ Önbellekteki {key} kaydı okunamadı: {str(e)}")
+            return None
+    
+    def _redis_set(self, key: str, series_id: str, series: Series):
+        """Seriyi Redis önbelleğine yaz (taze + eski kopya)"""
+        if self.redis is None:
+            return
+        buf = io.BytesIO()
+        _dump_series(series, buf)
+        try:
+            pipe = self.redis.pipeline()
+            pipe.setex(key, ttl_for(series_id), buf.getvalue())
+            pipe.setex(f"fred:npz:stale:{series_id}", _STALE_TTL, buf.getvalue())
+            pipe.execute()
+        except redis.RedisError as e:
+            self._log(f"⚠️ Önbelleğe yazılamadı: {str(e)}")
+    
+    def _disk_path(self, series_id: str) -> Path:
+        return self.cache_dir / datetime.now().strftime('%Y%m%d') / f"{series_id}.npz"
+    
+    def _disk_get(self, series_id: str, replay: bool = False) -> Optional[Series]:
+        """
+        Bugünün disk önbelleğinden, süresi dolmamışsa seri oku
+        replay=True ise süre kontrol edilmez ve bugün yoksa en son kaydedilen gün kullanılır
+        """
+        path = self._disk_path(series_id)
+        if replay and not path.exists():
+            saved = sorted(self.cache_dir.glob(f"*/{series_id}.npz"))  # Klasörler YYYYMMDD
+            if not saved:
+                return None
+            path = saved[-1]
+        try:
+            if not replay and time.time() - path.stat().st_mtime >= ttl_for(series_id):
+                return None
+            return _load_series(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._log(f"⚠️ {path} okunamadı: {str(e)}")
+            return None
+    
+    def _disk_set(self, series_id: str, series: Series):
+        """Seriyi disk önbelleğine yaz (yarım kalmış dosya okunmasın diye önce geçici dosyaya)"""
+        path = self._disk_path(series_id)
+        tmp = path.with_suffix('.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                _dump_series(series, f)
+            tmp.replace(path)
+        except OSError as e:
+            self._log(f"⚠️ {path} yazılamadı: {str(e)}")
+    
+    def get_fred_data(self, series_id: str, start_date: str = None, end_date: str = None) -> Series:
         """FRED API'den veri çek"""
+        # Disk önbelleği yalnızca varsayılan (son 1 yıl) aralık için kullanılır
+        use_disk = not start_date and not end_date and self.cache_mode != "disabled"
+        
+        if not start_date:
+            start_date = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
+        if not end_date:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        
+        cache_key = "fred:npz:" + hashlib.sha256(f"{series_id}|{start_date}|{end_date}".encode()).hexdigest()
+        
+        if self.cache_mode == "replay":
+            # API'ye gidilmez; süresi dolmuş olsa da önbellekteki son veri kullanılır
+            cached = self._disk_get(series_id, replay=True) if use_disk else None
+            if cached is None:
+                cached = self._redis_get(cache_key)
+            if cached is None:
+                cached = self._redis_get(f"fred:npz:stale:{series_id}")
+            if cached is None:
+                raise CacheMiss(f"cache miss: {series_id}")
+            return cached
+        
         try:
-            if not start_date:
-                start_date = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
-            if not end_date:
-                end_date = datetime.now().strftime('%Y-%m-%d')
+            if use_disk:
+                cached = self._disk_get(series_id)
+                if cached is not None:
+                    return cached
+            
+            cached = self._redis_get(cache_key)
+            if cached is not None:
+                return cached
             
-            url = f"{self.base_url}/series/observations"
             params = {
                 'series_id': series_id,
-                'api_key': self.fred_api_key,
-                'file_type': 'json',
                 'start_date': start_date,
-                'end_date': end_date,
-                'sort_order': 'desc',
-                'limit': 100
+                'end_date': end_date
             }
             
-            response = requests.get(url, params=params)
+            response = self._session.get(self._observations_url, params=params, timeout=self.request_timeout)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if 'observations' in data:
-                df = pd.DataFrame(data['observations'])
-                df['date'] = pd.to_datetime(df['date'])
-                df['value'] = pd.to_numeric(df['value'], errors='coerce')
-                df = df.dropna(subset=['value'])
-                df = df.sort_values('date')
-                return df
+                # sort_order=desc -> eskiden yeniye; FRED eksik değerleri "." ile gösterir
+                obs = [o for o in reversed(data['observations']) if o['value'] != '.']
+                if not obs:
+                    return self._EMPTY_SERIES
+                
+                dates = np.array([o['date'] for o in obs], dtype='datetime64[ns]')
+                values = np.fromiter((float(o['value']) for o in obs), dtype=np.float64, count=len(obs))
+                series = Series(dates, values)
+                self._redis_set(cache_key, series_id, series)
+                if use_disk:
+                    self._disk_set(series_id, series)
+                return series
             else:
-                print(f"⚠️ {series_id} için veri bulunamadı")
-                return pd.DataFrame()
+                self._log(f"⚠️ {series_id} için veri bulunamadı")
+                return self._EMPTY_SERIES
+        
+        except requests.RequestException as e:
+            self._log(f"❌ {series_id} verisi çekilirken hata: {str(e)}")
+            # API kesintisinde son başarılı veriyle rapor üretilebilsin
+            stale = self._redis_get(f"fred:npz:stale:{series_id}")
+            if stale is not None:
+                self._log(f"♻️ {series_id} için önbellekteki son veri kullanılıyor")
+                return stale
+            return self._EMPTY_SERIES
                 
         except Exception as e:
-            print(f"❌ {series_id} verisi çekilirken hata: {str(e)}")
-            return pd.DataFrame()
+            self._log(f"❌ {series_id} verisi çekilirken hata: {str(e)}")
+            return self._EMPTY_SERIES
     
-    def calculate_trend(self, df: pd.DataFrame, periods: int = 3) -> str:
-        """Trend analizi yap"""
-        if len(df) < periods:
-            return "Yetersiz veri"
-        
-        recent_values = df.tail(periods)['value'].values
-        
-        if len(recent_values) < 2:
-            return "Kararsız"
-        
-        changes = np.diff(recent_values)
-        avg_change = np.mean(changes)
-        
-        if avg_change > 0.1:
-            return "📈 Güçlü Yükseliş"
-        elif avg_change > 0.01:
-            return "🔼 Hafif Yükseliş"
-        elif avg_change < -0.1:
-            return "📉 Güçlü Düşüş"
-        elif avg_change < -0.01:
-            return "🔽 Hafif Düşüş"
-        else:
-            return "➡️ Stabil"
-    
-    def analyze_volatility(self, df: pd.DataFrame) -> str:
-        if len(df) < 10:
-            return "Yetersiz veri"
+    def calculate_trend(self, series: Series, periods: int = 3) -> Optional[Trend]:
+        """Trend analizi yap (yetersiz veride None)"""
+        v = series.values
+        if v.size < periods or periods < 2:
+            return None
         
-        returns = df['value'].pct_change().dropna()
-        volatility = returns.std()
+        # Son n değerin farklarının ortalaması = (son - ilk) / (n - 1)
+        avg_change = (v[-1] - v[-periods]) / (periods - 1)
         
-        if volatility > 0.1:
-            return "⚡ Yüksek Volatilite"
-        elif volatility > 0.05:
-            return "🌊 Orta Volatilite"
-        else:
-            return "🌊 Düşük Volatilite"
+        return Trend(int(np.searchsorted(_TREND_BINS, avg_change)))
     
-    def get_market_sentiment(self, data_dict: Dict) -> Tuple[str, str]:
-        positive_signals = 0
-        negative_signals = 0
-        total_signals = 0
-        
-        key_indicators = {
-            'UNRATE': 'negative',  # İşsizlik yüksek = negatif
-            'CPIAUCSL': 'negative',  # Enflasyon yüksek = negatif
-            'FEDFUNDS': 'negative',  # Faiz yüksek = negatif
-            'PAYEMS': 'positive',  # İstihdam artışı = pozitif
-            'UMCSENT': 'positive',  # Tüketici güveni = pozitif
-            'INDPRO': 'positive'   # Sanayi üretimi = pozitif
-        }
+    def analyze_volatility(self, series: Series) -> Optional[Volatility]:
+        v = series.values
+        if v.size < 10:
+            return None
+        
+        returns = np.diff(v) / v[:-1]  # Yüzde değişim
+        volatility = returns.std(ddof=1)  # Örneklem standart sapması
+        if np.isnan(volatility):  # Sıfır değerden getiri (inf) - eşik karşılaştırmaları gibi düşük say
+            return Volatility.LOW
         
-        for indicator, effect in key_indicators.items():
+        return Volatility(int(np.searchsorted(_VOLATILITY_BINS, volatility)))
+    
+    def get_market_sentiment(self, data_dict: Dict[str, Series]) -> Tuple[str, str]:
+        # Son değişimler tek dizide toplanır; verisi olmayan göstergeler NaN kalır
+        deltas = np.full(len(_SENTIMENT_EFFECTS), np.nan)
+        for i, indicator in enumerate(_SENTIMENT_EFFECTS):
             if indicator in data_dict:
-                df = data_dict[indicator]
-                if len(df) >= 2:
-                    recent_change = df.iloc[-1]['value'] - df.iloc[-2]['value']
-                    if effect == 'positive':
-                        if recent_change > 0:
-                            positive_signals += 1
-                        else:
-                            negative_signals += 1
-                    else:
-                        if recent_change > 0:
-                            negative_signals += 1
-                        else:
-                            positive_signals += 1
-                    total_signals += 1
+                v = data_dict[indicator].values
+                if v.size >= 2:
+                    deltas[i] = v[-1] - v[-2]
+        
+        valid = ~np.isnan(deltas)
+        total_signals = int(np.count_nonzero(valid))
+        # Pozitif etkili göstergede artış, negatif etkilide artmama olumlu sayılır
+        favourable = np.where(_SENTIMENT_SIGNS > 0, deltas > 0, deltas <= 0)
+        positive_signals = int(np.count_nonzero(favourable & valid))
         
         if total_signals == 0:
             return "🤷 Belirsiz", "MEDIUM"
         
         positive_ratio = positive_signals / total_signals
         
-        if positive_ratio >= 0.7:
-            return "🟢 Pozitif", "LOW"
-        elif positive_ratio >= 0.4:
-            return "🟡 Nötr", "MEDIUM"
-        else:
-            return "🔴 Negatif", "HIGH"
+        return _SENTIMENT_LEVELS[int(np.searchsorted(_SENTIMENT_BINS, positive_ratio, side='right'))]
     
-    def generate_trading_signals(self, data_dict: Dict) -> List[str]:
+    def _precompute(self, data_dict: Dict[str, Series]) -> Analysis:
+        """Trend, volatilite ve duyarlılığı her gösterge için bir kez hesapla"""
+        return Analysis(
+            trend={k: self.calculate_trend(series) for k, series in data_dict.items()},
+            vol={k: self.analyze_volatility(series) for k, series in data_dict.items()},
+            sentiment=self.get_market_sentiment(data_dict)
+        )
+    
+    def generate_trading_signals(self, data_dict: Dict[str, Series],
+                                 analysis: Optional[Analysis] = None) -> List[str]:
+        """analysis verilmezse data_dict üzerinden hesaplanır"""
         signals = []
         
         try:
-            if 'FEDFUNDS' in data_dict and len(data_dict['FEDFUNDS']) >= 3:
-                fed_data = data_dict['FEDFUNDS']
-                recent_fed = fed_data.tail(3)['value'].values
-                if len(recent_fed) >= 2:
-                    fed_trend = recent_fed[-1] - recent_fed[-2]
-                    if fed_trend < -0.25:
-                        signals.append("🟢 AL: Fed faiz indirimi - risk iştahı artabilir")
-                    elif fed_trend > 0.25:
-                        signals.append("🔴 SAT: Fed faiz artışı - risk iştahı azalabilir")
+            trends = (analysis or self._precompute(data_dict)).trend
+            
+            if 'FEDFUNDS' in data_dict and data_dict['FEDFUNDS'].values.size >= 3:
+                recent_fed = data_dict['FEDFUNDS'].values
+                fed_trend = recent_fed[-1] - recent_fed[-2]
+                if fed_trend < -0.25:
+                    signals.append("🟢 AL: Fed faiz indirimi - risk iştahı artabilir")
+                elif fed_trend > 0.25:
+                    signals.append("🔴 SAT: Fed faiz artışı - risk iştahı azalabilir")
             
-            if 'UNRATE' in data_dict and 'CPIAUCSL' in data_dict:
-                unemployment_trend = self.calculate_trend(data_dict['UNRATE'])
-                inflation_trend = self.calculate_trend(data_dict['CPIAUCSL'])
+            if trends.get('UNRATE') is not None and trends.get('CPIAUCSL') is not None:
+                unemployment_trend = trends['UNRATE']
+                inflation_trend = trends['CPIAUCSL']
                 
-                if "Düşüş" in unemployment_trend and "Düşüş" in inflation_trend:
+                if unemployment_trend <= Trend.DOWN and inflation_trend <= Trend.DOWN:
                     signals.append("🟢 AL: İşsizlik ve enflasyon düşüyor - ideal makro ortam")
-                elif "Yükseliş" in unemployment_trend and "Yükseliş" in inflation_trend:
+                elif unemployment_trend >= Trend.UP and inflation_trend >= Trend.UP:
                     signals.append("🔴 SAT: Stagflasyon riski - ekonomik zorluk")
             
-            if 'UMCSENT' in data_dict and len(data_dict['UMCSENT']) >= 2:
-                consumer_data = data_dict['UMCSENT']
-                recent_consumer = consumer_data.tail(2)['value'].values
-                if len(recent_consumer) >= 2:
-                    consumer_change = recent_consumer[-1] - recent_consumer[-2]
-                    if consumer_change > 5:
-                        signals.append("🟢 AL: Tüketici güveni güçlü artış")
-                    elif consumer_change < -5:
-                        signals.append("🔴 SAT: Tüketici güveni zayıflıyor")
+            if 'UMCSENT' in data_dict and data_dict['UMCSENT'].values.size >= 2:
+                recent_consumer = data_dict['UMCSENT'].values
+                consumer_change = recent_consumer[-1] - recent_consumer[-2]
+                if consumer_change > 5:
+                    signals.append("🟢 AL: Tüketici güveni güçlü artış")
+                elif consumer_change < -5:
+                    signals.append("🔴 SAT: Tüketici güveni zayıflıyor")
             
-            if 'PAYEMS' in data_dict and len(data_dict['PAYEMS']) >= 2:
-                employment_data = data_dict['PAYEMS']
-                recent_employment = employment_data.tail(2)['value'].values
-                if len(recent_employment) >= 2:
-                    employment_change = recent_employment[-1] - recent_employment[-2]
-                    if employment_change > 200:  # 200K üzeri istihdam artışı
-                        signals.append("🟢 AL: Güçlü istihdam artışı")
-                    elif employment_change < -50:
-                        signals.append("🔴 SAT: İstihdam kaybı")
+            if 'PAYEMS' in data_dict and data_dict['PAYEMS'].values.size >= 2:
+                recent_employment = data_dict['PAYEMS'].values
+                employment_change = recent_employment[-1] - recent_employment[-2]
+                if employment_change > 200:  # 200K üzeri istihdam artışı
+                    signals.append("🟢 AL: Güçlü istihdam artışı")
+                elif employment_change < -50:
+                    signals.append("🔴 SAT: İstihdam kaybı")
             
         except Exception as e:
             print(f"Sinyal üretiminde hata: {str(e)}")
@@ -215,43 +477,55 @@ class EconomicAnalyzer:
         
         return signals
     
-    def predict_next_day_events(self, data_dict: Dict) -> List[str]:
+    def predict_next_day_events(self, data_dict: Dict[str, Series],
+                                analysis: Optional[Analysis] = None) -> List[str]:
+        """analysis verilmezse data_dict üzerinden hesaplanır"""
         predictions = []
         
         try:
-            for indicator, name in self.indicators.items():
+            analysis = analysis or self._precompute(data_dict)
+            
+            # Tüm göstergelerin son 5 değeri tek matriste; 5 değerin trendi tek seferde hesaplanır
+            recent = self._scratch
+            recent.fill(np.nan)
+            for i, (indicator, _) in enumerate(self._indicator_items):
                 if indicator in data_dict:
-                    df = data_dict[indicator]
-                    if len(df) >= 5:
-                        trend = self.calculate_trend(df, periods=5)
-                        volatility = self.analyze_volatility(df)
-                        
-                        if "Güçlü Yükseliş" in trend:
-                            predictions.append(f"📈 {name}: Yükseliş devam edebilir")
-                        elif "Güçlü Düşüş" in trend:
-                            predictions.append(f"📉 {name}: Düşüş devam edebilir")
-                        elif "Yüksek Volatilite" in volatility:
-                            predictions.append(f"⚡ {name}: Yüksek volatilite beklentisi")
+                    values = data_dict[indicator].values
+                    if values.size >= 5:
+                        recent[i] = values[-5:]
+            
+            avg_changes = np.subtract(recent[:, -1], recent[:, 0], out=self._avg_buf)
+            np.divide(avg_changes, 4.0, out=avg_changes)
+            trend_bins = np.searchsorted(_TREND_BINS, avg_changes)
             
-            sentiment, risk = self.get_market_sentiment(data_dict)
+            for i in np.flatnonzero(~np.isnan(avg_changes)):
+                indicator, name = self._indicator_items[i]
+                if trend_bins[i] == Trend.STRONG_UP:
+                    predictions.append(f"📈 {name}: Yükseliş devam edebilir")
+                elif trend_bins[i] == Trend.STRONG_DOWN:
+                    predictions.append(f"📉 {name}: Düşüş devam edebilir")
+                elif analysis.vol[indicator] == Volatility.HIGH:
+                    predictions.append(f"⚡ {name}: Yüksek volatilite beklentisi")
             
-            if "Pozitif" in sentiment:
+            # Pozitif duyarlılık düşük, negatif duyarlılık yüksek risk olarak döner
+            sentiment, risk = analysis.sentiment
+            
+            if risk == "LOW":
                 predictions.append("🌟 Genel görünüm: Pozitif momentum sürebilir")
-            elif "Negatif" in sentiment:
+            elif risk == "HIGH":
                 predictions.append("⚠️ Genel görünüm: Negatif baskı devam edebilir")
             
             # Fed politika tahmini
             if 'FEDFUNDS' in data_dict and 'CPIAUCSL' in data_dict:
-                fed_data = data_dict['FEDFUNDS']
-                inflation_data = data_dict['CPIAUCSL']
+                fed_rates = data_dict['FEDFUNDS'].values
                 
-                if len(fed_data) >= 2 and len(inflation_data) >= 2:
-                    current_fed_rate = fed_data.iloc[-1]['value']
-                    inflation_trend = self.calculate_trend(inflation_data)
+                if fed_rates.size >= 2 and analysis.trend['CPIAUCSL'] is not None:
+                    current_fed_rate = fed_rates[-1]
+                    inflation_trend = analysis.trend['CPIAUCSL']
                     
-                    if current_fed_rate > 4.5 and "Düşüş" in inflation_trend:
+                    if current_fed_rate > 4.5 and inflation_trend <= Trend.DOWN:
                         predictions.append("🔮 Fed tahmini: Faiz indirimi sinyalleri güçlenebilir")
-                    elif current_fed_rate < 3.0 and "Yükseliş" in inflation_trend:
+                    elif current_fed_rate < 3.0 and inflation_trend >= Trend.UP:
                         predictions.append("🔮 Fed tahmini: Faiz artışı beklentisi artabilir")
             
         except Exception as e:
@@ -267,93 +541,79 @@ class EconomicAnalyzer:
         print("🔄 Ekonomik veri analizi başlatılıyor...")
         print("📊 Veriler çekiliyor...")
         
+        # I/O ağırlıklı iş - tüm istekler aynı anda gönderilir (14 istek FRED'in 120 istek/dk limitinin altında)
         data_dict = {}
-        for indicator in self.indicators.keys():
-            df = self.get_fred_data(indicator)
-            if not df.empty:
-                data_dict[indicator] = df
-            time.sleep(0.1)  # API rate limiting
+        with ThreadPoolExecutor(max_workers=len(self.indicators)) as executor:
+            futures = {executor.submit(self._fetch, indicator): indicator
+                       for indicator, _ in self._indicator_items}
+            for future in as_completed(futures):
+                series, messages = future.result()
+                for message in messages:
+                    print(message)
+                if series.values.size:
+                    data_dict[futures[future]] = series
         
         print("🧮 Analiz yapılıyor...")
+        analysis = self._precompute(data_dict)
+        
+        sentiment, risk_level = analysis.sentiment
+        signals = self.generate_trading_signals(data_dict, analysis)
+        predictions = self.predict_next_day_events(data_dict, analysis)
         
-        report = []
-        report.append("=" * 80)
-        report.append("📈 ABD EKONOMİK VERİ ANALİZİ RAPORU")
-        report.append("=" * 80)
-        report.append(f"📅 Tarih: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("")
+        buf = io.StringIO()
+        write = buf.write
         
-        report.append("📊 GÜNCEL EKONOMİK GÖSTERGELER")
-        report.append("-" * 50)
+        write(f"{'=' * 80}\n📈 ABD EKONOMİK VERİ ANALİZİ RAPORU\n{'=' * 80}\n")
+        write(f"📅 Tarih: {datetime.now():%Y-%m-%d %H:%M:%S}\n\n")
         
-        for indicator, name in self.indicators.items():
+        write(f"📊 GÜNCEL EKONOMİK GÖSTERGELER\n{'-' * 50}\n")
+        for indicator, name in self._indicator_items:
             if indicator in data_dict:
-                df = data_dict[indicator]
-                if not df.empty:
-                    latest_value = df.iloc[-1]['value']
-                    latest_date = df.iloc[-1]['date'].strftime('%Y-%m-%d')
-                    trend = self.calculate_trend(df)
-                    
-                    report.append(f"{name}: {latest_value:.2f} ({latest_date}) - {trend}")
-        
-        report.append("")
-        
-        sentiment, risk_level = self.get_market_sentiment(data_dict)
-        report.append("🎯 PİYASA DUYARLILIĞI")
-        report.append("-" * 50)
-        report.append(f"Genel Durum: {sentiment}")
-        report.append(f"Risk Seviyesi: {self.risk_levels[risk_level]}")
-        report.append("")
-        
-        signals = self.generate_trading_signals(data_dict)
-        report.append("🎯 AL/SAT SİNYALLERİ")
-        report.append("-" * 50)
-        for signal in signals:
-            report.append(f"• {signal}")
-        report.append("")
-        
-        predictions = self.predict_next_day_events(data_dict)
-        report.append("🔮 YARIN İÇİN TAHMİNLER")
-        report.append("-" * 50)
-        for prediction in predictions:
-            report.append(f"• {prediction}")
-        report.append("")
-        
-        report.append("💡 STRATEJİK ÖNERİLER")
-        report.append("-" * 50)
-        
-        if risk_level == "HIGH":
-            report.append("• ⚠️ Yüksek risk ortamı - pozisyon boyutlarını küçült")
-            report.append("• 🛡️ Hedge stratejileri değerlendir")
-            report.append("• 📰 Fed açıklamalarını yakından takip et")
-        elif risk_level == "MEDIUM":
-            report.append("• ⚖️ Dengeli yaklaşım - makro verileri izle")
-            report.append("• 📊 Teknik analiz ile kombine et")
-            report.append("• 🎯 Seçici olmaya odaklan")
-        else:
-            report.append("• 🟢 Düşük risk ortamı - fırsatları değerlendir")
-            report.append("• 📈 Trend takibi stratejileri uygula")
-            report.append("• 💪 Pozisyon boyutlarını artırabilirsin")
+                series = data_dict[indicator]
+                latest_date = np.datetime_as_string(series.dates[-1], unit='D')
+                write(f"{name}: {series.values[-1]:.2f} ({latest_date}) - {_TREND_TEXT[analysis.trend[indicator]]}\n")
+        write("\n")
+        
+        write(f"🎯 PİYASA DUYARLILIĞI\n{'-' * 50}\n")
+        write(f"Genel Durum: {sentiment}\nRisk Seviyesi: {self.risk_levels[risk_level]}\n\n")
+        
+        write(f"🎯 AL/SAT SİNYALLERİ\n{'-' * 50}\n")
+        write("".join(f"• {signal}\n" for signal in signals))
+        write("\n")
+        
+        write(f"🔮 YARIN İÇİN TAHMİNLER\n{'-' * 50}\n")
+        write("".join(f"• {prediction}\n" for prediction in predictions))
+        write("\n")
         
-        report.append("")
-        report.append("=" * 80)
-        report.append("⚡ Analiz tamamlandı! Başarılı yatırımlar dilerim.")
-        report.append("=" * 80)
+        write(f"💡 STRATEJİK ÖNERİLER\n{'-' * 50}\n")
+        write("".join(f"• {tip}\n" for tip in _STRATEGY_TIPS[risk_level]))
+        write("\n")
         
-        return "\n".join(report)
+        write(f"{'=' * 80}\n⚡ Analiz tamamlandı! Başarılı yatırımlar dilerim.\n{'=' * 80}")
+        
+        return buf.getvalue()
 
 if __name__ == "__main__":
     FRED_API_KEY = "YOUR_FRED_API_KEY_HERE"
-
+    REDIS_URL = None  # Önbellek için örn. "redis://localhost:6379/0"
     
-    if FRED_API_KEY == "YOUR_FRED_API_KEY_HERE":
+    parser = argparse.ArgumentParser(description="ABD ekonomik veri analizi ve tahmin raporu")
+    parser.add_argument("--mode", choices=CACHE_MODES, default="enabled",
+                        help="önbellek modu: enabled (varsayılan), replay (yalnızca önbellekteki veriler, "
+                             "API'ye gidilmez), disabled (önbellek kullanılmaz)")
+    args = parser.parse_args()
+    
+    if FRED_API_KEY == "YOUR_FRED_API_KEY_HERE" and args.mode != "replay":
         print("❌ FRED API anahtarı gerekli!")
         print("📝 https://fred.stlouisfed.org/docs/api/api_key.html adresinden API anahtarı alın")
         print("🔧 Kodu düzenleyerek API anahtarınızı girin")
     else:
-        analyzer = EconomicAnalyzer(FRED_API_KEY)
+        analyzer = EconomicAnalyzer(FRED_API_KEY, redis_url=REDIS_URL, cache_mode=args.mode)
         
-        report = analyzer.run_daily_analysis()
+        try:
+            report = analyzer.run_daily_analysis()
+        except CacheMiss as e:
+            raise SystemExit(f"❌ Replay modunda önbellekte olmayan veri ({str(e)}) - önce normal modda çalıştırın")
         print(report)
         
         # Raporu dosyaya kaydet